@@ -1,8 +1,60 @@
+import contextlib
+import functools
+
 import sqlalchemy as sa
 import sqlalchemy.dialects.postgresql as sap
 from config.config import Config
 
 
+@functools.lru_cache(maxsize=None)
+def _get_engine(connection_string: str) -> sa.engine.Engine:
+    """
+    Create (or return the cached) pooled engine for a connection string.
+
+    The engine is shared by every DBHandler pointing at the same database,
+    so concurrent station pipelines draw short-lived connections from one
+    pool instead of each paying a fresh TCP/SSL handshake.
+
+    Args:
+        connection_string: The database connection string.
+
+    Returns:
+        sa.engine.Engine: The shared SQLAlchemy engine instance.
+    """
+    return sa.create_engine(
+        connection_string,
+        pool_size=10,
+        max_overflow=5,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        future=True,
+        execution_options={"compiled_cache": {}},
+    )
+
+
+# Tables the pipeline operates on; reflection is limited to these
+PIPELINE_TABLES = ("dim_station", "fact_observation")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_metadata(engine: sa.engine.Engine) -> sa.MetaData:
+    """
+    Reflect (once per engine) the tables used by the pipeline.
+
+    Reflection issues several pg_catalog queries, so the result is cached
+    and shared by every DBHandler built on the same engine.
+
+    Args:
+        engine: The engine to reflect against.
+
+    Returns:
+        sa.MetaData: Metadata holding the reflected pipeline tables.
+    """
+    metadata = sa.MetaData()
+    metadata.reflect(bind=engine, only=PIPELINE_TABLES)
+    return metadata
+
+
 class DBHandler:
     """
     Database handler for managing PostgreSQL database connections and operations.
@@ -19,8 +71,8 @@ class DBHandler:
         self.connection_string = self.__create_connection_string()
         self.engine = self.__create_engine()
         self.conn = self.engine.connect()
-        self.metadata = sa.MetaData()
-        self.metadata.reflect(bind=self.engine)
+        self.metadata = _get_metadata(self.engine)
+        self._col_cache: dict[str, dict[str, sa.Column]] = {}
 
     def __create_connection_string(self) -> str:
         """
@@ -42,13 +94,45 @@ class DBHandler:
 
     def __create_engine(self) -> sa.engine.Engine:
         """
-        Create a SQLAlchemy engine from the connection string.
+        Return the shared pooled SQLAlchemy engine for the connection string.
 
         Returns:
             sa.engine.Engine: The SQLAlchemy engine instance.
         """
-        connection_string = self.__create_connection_string()
-        return sa.create_engine(connection_string)
+        return _get_engine(self.connection_string)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Context manager that groups multiple operations into a single transaction.
+
+        Commits on successful exit and rolls back on error. If a transaction is
+        already in progress, the operations join it instead of starting a new one.
+        """
+        if self.conn.in_transaction():
+            yield
+            return
+        with self.conn.begin():
+            yield
+
+    def _columns(self, table: sa.Table) -> dict[str, sa.Column]:
+        """
+        Return the cached name -> Column mapping for a table.
+
+        Avoids repeated `getattr(table.c, col)` descriptor dispatch in the
+        statement-building paths.
+
+        Args:
+            table (sa.Table): The table whose columns are needed.
+
+        Returns:
+            dict[str, sa.Column]: Mapping of column name to Column object.
+        """
+        columns = self._col_cache.get(table.name)
+        if columns is None:
+            columns = {col.name: col for col in table.c}
+            self._col_cache[table.name] = columns
+        return columns
 
     def insert_many(
         self, table: sa.Table, data: list[dict], returning_cols: list[str] | None = None
@@ -68,13 +152,31 @@ class DBHandler:
 
         stmt = sa.insert(table).values(data)
         if returning_cols:
-            stmt = stmt.returning(*[getattr(table.c, col) for col in returning_cols])
+            columns = self._columns(table)
+            stmt = stmt.returning(*[columns[col] for col in returning_cols])
 
         result = self.conn.execute(stmt)
-        self.conn.commit()
 
         return result
 
+    def execute_raw(self, sql: str, params: dict | None = None) -> int:
+        """
+        Executes a single statement on the raw DBAPI cursor.
+
+        Args:
+            sql (str): The statement to execute, with pyformat placeholders.
+            params (dict | None, optional): Parameters to bind.
+
+        Returns:
+            int: The rowcount reported by the cursor.
+        """
+        cursor = self.conn.connection.cursor()
+        try:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
     def update(
         self,
         table: sa.Table,
@@ -97,18 +199,18 @@ class DBHandler:
             sa.CursorResult: The result of the update operation.
         """
 
+        columns = self._columns(table)
         where_clause = sa.and_(
-            *[getattr(table.c, col) == values[col] for col in matching_columns]
+            *[columns[col] == values[col] for col in matching_columns]
         )
         update_dict = {col: values[col] for col in fields_to_update if col in values}
 
         stmt = sa.update(table).where(where_clause).values(**update_dict)
 
         if returning_columns:
-            stmt = stmt.returning(*[getattr(table.c, col) for col in returning_columns])
+            stmt = stmt.returning(*[columns[col] for col in returning_columns])
 
         result = self.conn.execute(stmt)
-        self.conn.commit()
         return result
 
     def upsert(
@@ -132,6 +234,7 @@ class DBHandler:
         Returns:
             sa.CursorResult: The result of the upsert operation.
         """
+        columns = self._columns(table)
         stmt = sap.insert(table).values(**values)
 
         stmt = stmt.on_conflict_do_update(
@@ -140,24 +243,19 @@ class DBHandler:
         )
 
         if returning_columns:
-            stmt = stmt.returning(*[getattr(table.c, col) for col in returning_columns])
+            stmt = stmt.returning(*[columns[col] for col in returning_columns])
 
         result = self.conn.execute(stmt)
-        self.conn.commit()
         return result
 
     def close(self):
         """
-        Closes the database connection
+        Returns the database connection to the shared pool.
+
+        The engine itself is shared between handlers and stays alive.
         """
         try:
             if hasattr(self, "conn") and self.conn:
                 self.conn.close()
         except Exception:
             pass
-
-        try:
-            if hasattr(self, "engine") and self.engine:
-                self.engine.dispose()
-        except Exception:
-            pass
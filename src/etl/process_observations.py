@@ -1,11 +1,55 @@
+import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import List
+from typing import AsyncIterator, List
+import ijson
+import pandas as pd
 from utils.api_client import APIClient
 from db.handler import DBHandler
 from config.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Inserts an observation batch and advances the station's last observation
+# timestamp in the same statement. The batch travels as one column array per
+# field (the unnest pattern), so each batch is a single Bind with five
+# parameters instead of a VALUES list, and nothing is fetched back: the
+# RETURNING feeds only the server-side MAX.
+INSERT_OBSERVATIONS_SQL = """
+    WITH ins AS (
+        INSERT INTO fact_observation
+            (station_sk, observation_timestamp, temperature, wind_speed, humidity)
+        SELECT
+            %(station_sk)s,
+            unnest(%(timestamps)s::timestamptz[]),
+            unnest(%(temperatures)s::numeric[]),
+            unnest(%(wind_speeds)s::numeric[]),
+            unnest(%(humidities)s::numeric[])
+        RETURNING observation_timestamp
+    )
+    UPDATE dim_station
+    SET last_observation_at = GREATEST(
+        last_observation_at,
+        (SELECT MAX(observation_timestamp) FROM ins)
+    )
+    WHERE station_sk = %(station_sk)s
+"""
+
+# Number of observation rows kept resident before flushing to the database
+BATCH_SIZE = 1000
+
+# Fetch window deltas, built once instead of per request
+DEFAULT_LOOKBACK = timedelta(days=7)
+ONE_SECOND = timedelta(seconds=1)
+
+# Flattened API property -> database column mapping
+FIELD_MAP = {
+    "properties.timestamp": "observation_timestamp",
+    "properties.temperature.value": "temperature",
+    "properties.windSpeed.value": "wind_speed",
+    "properties.relativeHumidity.value": "humidity",
+}
+
+
 class ObservationProcessor:
     """
     Processes observation data from the weather API and manages observation information in the database.
@@ -22,11 +66,12 @@ class ObservationProcessor:
         self.db_client = db_client
         self.api_client = api_client
 
-    def process_observations(
+    async def process_observations(
         self,
         station_id: str,
         station_sk: int,
         last_observation_timestamp: datetime | None = None,
+        now_utc: datetime | None = None,
     ) -> bool:
         """
         Fetches, processes, and loads observations for a station.
@@ -35,185 +80,173 @@ class ObservationProcessor:
             station_id: The ID of the station to fetch observations for.
             station_sk: The surrogate key of the station.
             last_observation_timestamp: The last observation timestamp to filter new observations.
+            now_utc: End of the fetch window; computed by the caller so one
+                timestamp is shared across concurrent stations.
 
         Returns:
             bool: True if observations were loaded successfully, False otherwise.
         """
         observations_raw = self._get_observations_raw_data(
-            station_id, last_observation_timestamp
+            station_id, last_observation_timestamp, now_utc
         )
+        loaded = await self._load_observations(observations_raw, station_sk)
 
-        if not observations_raw:
+        if not loaded:
             logger.info("No observations found for station %s", station_id)
-            return False
+        return loaded
 
-        observations_data = self._extract_observations_fields(
-            observations_raw, station_sk
-        )
-        return self._load_observations(observations_data, station_sk)
-
-    def _get_observations_raw_data(
-        self, station_id: str, last_observation_timestamp: datetime | None = None
-    ) -> List[dict]:
+    async def _get_observations_raw_data(
+        self,
+        station_id: str,
+        last_observation_timestamp: datetime | None = None,
+        now_utc: datetime | None = None,
+    ) -> AsyncIterator[dict]:
         """
-        Fetches raw observation data from the API.
+        Streams raw observation data from the API.
+
+        Observations are parsed incrementally from the response body with
+        `ijson`, so the full GeoJSON payload is never materialized in memory.
 
         Args:
             station_id: The ID of the station to fetch observations for.
             last_observation_timestamp: The last observation timestamp to filter new observations.
+            now_utc: End of the fetch window; falls back to the current time.
 
-        Returns:
-            List[dict]: A list of dictionaries representing observations.
+        Yields:
+            dict: A dictionary representing a single observation.
         """
-        now_utc = datetime.now(timezone.utc)
+        if now_utc is None:
+            now_utc = datetime.now(timezone.utc)
         if last_observation_timestamp is None:
             logger.info(
                 "No last observation timestamp provided, fetching observations from the last 7 days."
             )
-            start_date = (now_utc - timedelta(days=7)).isoformat()
+            start_date = (now_utc - DEFAULT_LOOKBACK).isoformat(timespec="seconds")
         else:
-            start_date = (last_observation_timestamp + timedelta(seconds=1)).isoformat()
-        end_date = now_utc.isoformat()
+            start_date = (last_observation_timestamp + ONE_SECOND).isoformat(
+                timespec="seconds"
+            )
+        end_date = now_utc.isoformat(timespec="seconds")
 
-        response = self.api_client.get(
+        response = await self.api_client.get_stream(
             f"/stations/{station_id}/observations/",
             params={"start": start_date, "end": end_date},
         )
-        return response.json().get("features", [])
+        try:
+            async for observation in ijson.items(response.content, "features.item"):
+                yield observation
+        finally:
+            response.release()
 
     def _extract_observations_fields(
         self, observations_raw: List[dict], station_sk: int
-    ) -> List[dict]:
+    ) -> dict:
         """
-        Extracts observation fields from raw API data.
-
-        Args:
-            observations_raw: List of raw observation dictionaries from API.
-            station_sk: The surrogate key of the station.
-
-        Returns:
-            List[dict]: List of processed observation dictionaries.
-        """
-        return [
-            self._extract_observation_fields(obs, station_sk)
-            for obs in observations_raw
-        ]
-
-    def _extract_observation_fields(self, observation: dict, station_sk: int) -> dict:
-        """
-        Extracts temperature, wind speed, and humidity from an observation.
+        Extracts observation fields from a batch of raw observations, vectorized
+        with pandas, as INSERT_OBSERVATIONS_SQL column-array parameters.
 
         Fields mapping:
         - 'station_sk': Surrogate key of the station
-        - 'observation_timestamp': 'properties.timestamp'
-        - 'temperature': 'properties.temperature.value'
-        - 'wind_speed': 'properties.windSpeed.value'
-        - 'humidity': 'properties.relativeHumidity.value'
+        - 'timestamps': 'properties.timestamp'
+        - 'temperatures': 'properties.temperature.value'
+        - 'wind_speeds': 'properties.windSpeed.value'
+        - 'humidities': 'properties.relativeHumidity.value'
+
+        The flatten and null handling run as column-wise pandas operations
+        instead of per-row Python dict walking; rounding to two decimals
+        happens in Postgres via the NUMERIC(5, 2) column types.
 
         Args:
-            observation: A dictionary representing a single observation.
+            observations_raw: List of raw observation dictionaries from API.
             station_sk: The surrogate key of the station.
 
         Returns:
-            dict: A dictionary containing processed observation fields.
-        """
-        properties = observation.get("properties")
-        if not properties:
-            logger.error("Mandatory 'properties' field is missing.")
-            raise ValueError("Mandatory 'properties' field is missing.")
-
-        timestamp = properties.get("timestamp")
-        if not timestamp:
+            dict: Parameters for INSERT_OBSERVATIONS_SQL, one list per column.
+        """
+        df = pd.json_normalize(observations_raw, sep=".")
+
+        for field, column in FIELD_MAP.items():
+            if field not in df.columns:
+                df[field] = None
+                if column != "observation_timestamp":
+                    logger.warning(
+                        "Optional field '%s' is missing for station %s.",
+                        field.split(".")[1],
+                        station_sk,
+                    )
+        df = df[list(FIELD_MAP)].rename(columns=FIELD_MAP)
+
+        if df["observation_timestamp"].isna().any():
             logger.error("Mandatory 'timestamp' field is missing in observation.")
             raise ValueError("Mandatory 'timestamp' field is missing in observation.")
 
-        temperature = self._get_rounded_value(properties, "temperature", station_sk)
-        wind_speed = self._get_rounded_value(properties, "windSpeed", station_sk)
-        humidity = self._get_rounded_value(properties, "relativeHumidity", station_sk)
-
+        # Hand off through one object ndarray: the NaN -> None replacement
+        # (psycopg2 expects None for missing values) runs as a single
+        # C-level masked assignment instead of a per-column DataFrame pass.
+        # No client-side rounding: the NUMERIC(5, 2) columns round on insert.
+        values = df.to_numpy(dtype=object)
+        values[pd.isna(values)] = None
+        timestamps, temperatures, wind_speeds, humidities = values.T
         return {
             "station_sk": station_sk,
-            "observation_timestamp": timestamp,
-            "temperature": temperature,
-            "wind_speed": wind_speed,
-            "humidity": humidity,
+            "timestamps": list(timestamps),
+            "temperatures": list(temperatures),
+            "wind_speeds": list(wind_speeds),
+            "humidities": list(humidities),
         }
 
-    def _get_rounded_value(
-        self, properties: dict, field: str, station_sk: int
-    ) -> float | None:
-        """
-        Extract and round a numeric value from observation properties.
-
-        Args:
-            properties: Properties dictionary from observation
-            field: Field name to extract
-            station_sk: Station surrogate key for logging
-
-        Returns:
-            Rounded value or None if missing
-        """
-        value = properties.get(field, {}).get("value")
-        if value is None:
-            logger.warning(
-                "Optional field '%s' is missing for station %s.", field, station_sk
-            )
-            return None
-        return round(value, 2)
-
-    def _load_observations(
-        self, observations_data: List[dict], station_sk: int
+    async def _load_observations(
+        self, observations_raw: AsyncIterator[dict], station_sk: int
     ) -> bool:
         """
-        Loads observations into the database and updates station's last observation timestamp.
+        Extracts and loads streamed observations into the database in batches.
+
+        At most BATCH_SIZE raw observations are held in memory at a time; each
+        batch is vectorized through _extract_observations_fields and inserted
+        with INSERT_OBSERVATIONS_SQL, which also advances the station's
+        last_observation_at server-side in the same round-trip.
 
         Args:
-            observations_data: List of processed observation dictionaries.
+            observations_raw: Async iterator of raw observation dictionaries.
             station_sk: The surrogate key of the station.
 
         Returns:
             bool: True if observations were loaded successfully.
         """
-        fact_observation_table = self.db_client.metadata.tables["fact_observation"]
-
-        result = self.db_client.insert_many(
-            fact_observation_table,
-            observations_data,
-            returning_cols=["observation_timestamp"],
-        )
+        inserted_count = 0
+        batch: List[dict] = []
+        async for observation in observations_raw:
+            batch.append(observation)
+            if len(batch) >= BATCH_SIZE:
+                inserted_count += await asyncio.to_thread(
+                    self._insert_observations_batch, batch, station_sk
+                )
+                batch = []
+        if batch:
+            inserted_count += await asyncio.to_thread(
+                self._insert_observations_batch, batch, station_sk
+            )
 
-        inserted_timestamps = result.fetchall()
-        if not inserted_timestamps:
+        if not inserted_count:
             logger.debug("No observations were inserted for station %s", station_sk)
             return False
 
-        # Update the station's last observation timestamp
-        last_timestamp = max([ts[0] for ts in inserted_timestamps])
-        self._update_station_last_observation(station_sk, last_timestamp)
-
         logger.info(
-            "Loaded %d observations for station %s. Last timestamp: %s",
-            len(inserted_timestamps),
-            station_sk,
-            last_timestamp,
+            "Loaded %d observations for station %s.", inserted_count, station_sk
         )
         return True
 
-    def _update_station_last_observation(
-        self, station_sk: int, last_timestamp: datetime
-    ):
+    def _insert_observations_batch(self, batch: List[dict], station_sk: int) -> int:
         """
-        Updates the station's last observation timestamp.
+        Extracts and inserts a single batch of raw observations.
 
         Args:
+            batch: Raw observation dictionaries to insert.
             station_sk: The surrogate key of the station.
-            last_timestamp: The last observation timestamp to update.
-        """
-        dim_station_table = self.db_client.metadata.tables["dim_station"]
 
-        self.db_client.update(
-            dim_station_table,
-            values={"station_sk": station_sk, "last_observation_at": last_timestamp},
-            matching_columns=["station_sk"],
-            fields_to_update=["last_observation_at"],
-        )
+        Returns:
+            int: The number of rows inserted.
+        """
+        params = self._extract_observations_fields(batch, station_sk)
+        self.db_client.execute_raw(INSERT_OBSERVATIONS_SQL, params)
+        return len(params["timestamps"])
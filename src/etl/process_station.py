@@ -1,3 +1,4 @@
+import asyncio
 from utils.api_client import APIClient
 from db.handler import DBHandler
 from datetime import datetime
@@ -21,8 +22,9 @@ class StationProcessor:
         """
         self.db_client = db_client
         self.api_client = api_client
+        self.dim_station_table = db_client.metadata.tables["dim_station"]
 
-    def process_station(self, station_id: str) -> tuple[int, datetime | None]:
+    async def process_station(self, station_id: str) -> tuple[int, datetime | None]:
         """
         Fetches, processes, and upserts a station, returning its surrogate key and last observation timestamp.
 
@@ -32,9 +34,11 @@ class StationProcessor:
         Returns:
             tuple[int, datetime | None]: A tuple containing the station's surrogate key and last observation timestamp.
         """
-        station_raw_data = self._get_station_raw_data(station_id)
+        station_raw_data = await self._get_station_raw_data(station_id)
         station_data = self._extract_station_fields(station_raw_data)
-        return self._create_or_update_station(station_data)
+        # The upsert is a blocking DB call; run it off the event loop so
+        # other station pipelines keep making progress.
+        return await asyncio.to_thread(self._create_or_update_station, station_data)
 
     def _extract_station_fields(self, station: dict) -> dict:
         """
@@ -79,7 +83,7 @@ class StationProcessor:
             "latitude": latitude,
         }
 
-    def _get_station_raw_data(self, station_id: str) -> dict:
+    async def _get_station_raw_data(self, station_id: str) -> dict:
         """
         Fetches raw station data from the API.
 
@@ -89,8 +93,7 @@ class StationProcessor:
         Returns:
             dict: A dictionary containing raw station data from the API.
         """
-        response = self.api_client.get(f"/stations/{station_id}")
-        return response.json()
+        return await self.api_client.get_json(f"/stations/{station_id}")
 
     def _create_or_update_station(
         self, station_data: dict
@@ -105,10 +108,8 @@ class StationProcessor:
             tuple[int, datetime | None]: A tuple containing the station's surrogate key 
                                         and last observation timestamp.
         """
-        dim_station_table = self.db_client.metadata.tables["dim_station"]
-
         result = self.db_client.upsert(
-            table=dim_station_table,
+            table=self.dim_station_table,
             values=station_data,
             conflict_columns=["station_id"],
             update_columns=[
@@ -10,87 +10,112 @@ from config.logger import setup_logger
 
 logger = setup_logger('INSIGHTS')
 
-
-def get_station_avg_last_week_temperature(
-    station_id: str, db_client: DBHandler
-) -> None:
-    """Get last week's average temperature for a specific station."""
-    query = """
-        WITH date_interval AS (
-            SELECT
-                DATE_TRUNC('week', NOW()::timestamp) - INTERVAL '1 week' AS start_date, 
-                DATE_TRUNC('week', NOW()::timestamp) AS end_date
-        )
+# Built once at import so every call reuses the same construct and hits the
+# engine's compiled-statement cache. The window sizes are bound parameters,
+# so different windows share a single server-side plan.
+INSIGHTS_STMT = text("""
+    WITH station AS (
+        SELECT
+            station_sk,
+            station_id,
+            station_name
+        FROM dim_station
+        WHERE station_id = :station_id
+    ),
+    date_interval AS (
+        SELECT
+            DATE_TRUNC('week', NOW()::timestamp) - (:weeks_back * INTERVAL '1 week') AS start_date,
+            DATE_TRUNC('week', NOW()::timestamp) AS end_date
+    ),
+    avg_temperature AS (
         SELECT
-            st.station_id,
-            st.station_name,
             ROUND(AVG(obs.temperature), 2) AS avg_temperature
         FROM
             fact_observation AS obs
         INNER JOIN
-            dim_station AS st ON obs.station_sk = st.station_sk
+            station AS st ON obs.station_sk = st.station_sk
         INNER JOIN
             date_interval AS di ON obs.observation_timestamp BETWEEN di.start_date AND di.end_date
-        WHERE
-            st.station_id = :station_id
-        GROUP BY
-            st.station_id,
-            st.station_name;
-    """
-
-    result = db_client.conn.execute(text(query), {"station_id": station_id})
-    row = result.fetchone()
-
-    if row:
-        logger.info(
-            f"Station ID: {row.station_id}, Station Name: {row.station_name}, Average Temperature: {row.avg_temperature}"
-        )
-    else:
-        logger.warning(f"No insights found for station ID: {station_id}")
-
-
-def get_station_max_wind_speed_change(station_id: str, db_client: DBHandler) -> None:
-    """Get the maximum wind speed change for a specific station in the last 7 days."""
-    query = """
-        WITH wind_speed_change AS (
+    ),
+    wind_speed_change AS (
+        SELECT
+            MAX(wind_speed - previous_wind_speed) AS max_wind_speed_change
+        FROM (
             SELECT
-                obs.station_sk,
-                obs.observation_timestamp,
-                st.station_id,
-                st.station_name,
                 obs.wind_speed,
                 LAG(obs.wind_speed) OVER (
                     PARTITION BY obs.station_sk
                     ORDER BY obs.observation_timestamp
                 ) AS previous_wind_speed
             FROM fact_observation AS obs
-            JOIN dim_station AS st ON obs.station_sk = st.station_sk
+            INNER JOIN station AS st ON obs.station_sk = st.station_sk
             WHERE obs.wind_speed IS NOT NULL
-              AND obs.observation_timestamp >= NOW() - INTERVAL '7 days'
-        )
-        SELECT
-            station_id,
-            station_name,
-            MAX(wind_speed - previous_wind_speed) AS max_wind_speed_change
-        FROM wind_speed_change
+              AND obs.observation_timestamp >= NOW() - (:lookback_days * INTERVAL '1 day')
+        ) AS diffs
         WHERE previous_wind_speed IS NOT NULL
-          AND station_id = :station_id
-        GROUP BY station_id, station_name;
+    )
+    SELECT
+        st.station_id,
+        st.station_name,
+        at.avg_temperature,
+        wsc.max_wind_speed_change
+    FROM station AS st
+    CROSS JOIN avg_temperature AS at
+    CROSS JOIN wind_speed_change AS wsc;
+""")
+
+
+def get_station_insights(
+    station_id: str,
+    db_client: DBHandler,
+    weeks_back: int = 1,
+    lookback_days: int = 7,
+) -> None:
     """
+    Get last week's average temperature and the maximum wind speed change
+    over the last 7 days for a specific station, in a single query.
 
-    result = db_client.conn.execute(text(query), {"station_id": station_id})
+    Both metrics resolve the station once and read fact_observation through
+    its (station_sk, observation_timestamp) primary key, so the whole report
+    costs one round-trip instead of two.
+    """
+    result = db_client.conn.execute(
+        INSIGHTS_STMT,
+        {
+            "station_id": station_id,
+            "weeks_back": weeks_back,
+            "lookback_days": lookback_days,
+        },
+    )
     row = result.fetchone()
 
-    if row:
+    if row is None:
+        logger.warning(f"No insights found for station ID: {station_id}")
+        return
+
+    # The CROSS JOIN always yields a row when the station exists; a NULL
+    # metric means no observations fell in that window, which the separate
+    # queries used to report through their no-row warning path
+    if row.avg_temperature is not None:
+        logger.info(
+            f"Station ID: {row.station_id}, Station Name: {row.station_name}, Average Temperature: {row.avg_temperature}"
+        )
+    else:
+        logger.warning(
+            f"No average temperature insight found for station ID: {station_id}"
+        )
+
+    if row.max_wind_speed_change is not None:
         logger.info(
             f"Station ID: {row.station_id}, Station Name: {row.station_name}, Max Wind Speed Change: {row.max_wind_speed_change}"
         )
     else:
-        logger.warning(f"No insights found for station ID: {station_id}")
+        logger.warning(
+            f"No wind speed change insight found for station ID: {station_id}"
+        )
 
 
 if __name__ == "__main__":
     db_client = DBHandler(config)
     # Example usage
-    get_station_avg_last_week_temperature("0128W", db_client)
-    get_station_max_wind_speed_change("0128W", db_client)
+    get_station_insights("0128W", db_client)
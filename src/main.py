@@ -1,71 +1,147 @@
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from etl.process_station import StationProcessor
 from etl.process_observations import ObservationProcessor
 from db.handler import DBHandler
 from utils.api_client import APIClient
 from config.config import config
 from config.logger import setup_logger
-from insights.get_insights import (
-    get_station_avg_last_week_temperature,
-    get_station_max_wind_speed_change,
-)
+from insights.get_insights import get_station_insights
+
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    uvloop = None
 
 # Create logger for this module
 logger = setup_logger(__name__)
 
+# Upper bound on stations processed at once: one below the connection pool's
+# capacity (pool_size=10 + max_overflow=5), leaving a connection free for the
+# insights handler so no pipeline ever blocks the loop waiting on a checkout
+MAX_CONCURRENT_PIPELINES = 14
 
-def main():
-    """Main function to run the weather data pipeline."""
+
+async def process_station_pipeline(
+    station_id: str,
+    api_client: APIClient,
+    now_utc: datetime,
+    semaphore: asyncio.Semaphore,
+):
+    """Run the station upsert and observation load for a single station.
+
+    Each pipeline gets its own DBHandler (and pooled connection), so
+    concurrent stations do not share a transaction. The semaphore keeps the
+    number of simultaneous pipelines below the pool's capacity; the handler
+    is built off-loop because connecting (or waiting on the pool) blocks.
+    """
+    async with semaphore:
+        db_handler = await asyncio.to_thread(DBHandler, config)
+        try:
+            station_processor = StationProcessor(db_handler, api_client)
+            observation_processor = ObservationProcessor(db_handler, api_client)
+
+            logger.info(f"Processing station: {station_id}")
+
+            with db_handler.transaction():
+                station_sk, last_observation_timestamp = (
+                    await station_processor.process_station(station_id)
+                )
+                logger.info(
+                    f"Station processed. SK: {station_sk}, Last observation: {last_observation_timestamp}"
+                )
+
+                await observation_processor.process_observations(
+                    station_id,
+                    station_sk,
+                    last_observation_timestamp,
+                    now_utc,
+                )
+        finally:
+            await asyncio.to_thread(db_handler.close)
+
+
+async def run_pipeline(station_ids: list[str]):
+    """Run the weather data pipeline for the given stations concurrently."""
     db_handler = None
     api_client = None
 
     try:
-        parser = argparse.ArgumentParser(description="Weather data pipeline")
-        parser.add_argument("--station_id", help="Station ID to process", required=True)
-        args = parser.parse_args()
-
-        station_id = args.station_id.strip()
+        # Blocking DB calls are pushed to threads via asyncio.to_thread;
+        # size the pool to the work instead of the interpreter default
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=min(len(station_ids), 16))
+        )
 
         # Initialize components
-        db_handler = DBHandler(config)
+        db_handler = await asyncio.to_thread(DBHandler, config)
         api_client = APIClient(config.WEATHER_API_BASE_URL, timeout=config.API_TIMEOUT)
+        await api_client.ping()
         logger.info("Initialized API client and database handler")
 
-        # Create processors
-        station_processor = StationProcessor(db_handler, api_client)
-        observation_processor = ObservationProcessor(db_handler, api_client)
+        # One fetch-window end shared by every station in this run
+        now_utc = datetime.now(timezone.utc)
 
-        # Process station and observations
-        logger.info(f"Processing station: {station_id}")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PIPELINES)
 
-        station_sk, last_observation_timestamp = station_processor.process_station(
-            station_id
-        )
-        logger.info(
-            f"Station processed. SK: {station_sk}, Last observation: {last_observation_timestamp}"
+        # return_exceptions keeps sibling pipelines running to completion, so
+        # the shared session is never closed out from under an active task
+        results = await asyncio.gather(
+            *(
+                process_station_pipeline(station_id, api_client, now_utc, semaphore)
+                for station_id in station_ids
+            ),
+            return_exceptions=True,
         )
 
-        observation_processor.process_observations(
-            station_id,
-            station_sk,
-            last_observation_timestamp,
-        )
+        failed = []
+        for station_id, result in zip(station_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Station {station_id} failed: {result}")
+                failed.append(station_id)
+
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {len(station_ids)} station pipelines failed: "
+                f"{', '.join(failed)}"
+            )
 
         logger.info("Weather data pipeline completed successfully")
 
         # Get insights
-        get_station_avg_last_week_temperature(station_id, db_handler)
-        get_station_max_wind_speed_change(station_id, db_handler)
+        for station_id in station_ids:
+            get_station_insights(station_id, db_handler)
 
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
         raise  # RETRY OR ALERT IN THE MACRO SYSTEM
     finally:
         if api_client:
-            api_client.close()
+            await api_client.close()
         if db_handler:
             db_handler.close()
 
 
+def main():
+    """Main function to run the weather data pipeline."""
+    parser = argparse.ArgumentParser(description="Weather data pipeline")
+    parser.add_argument(
+        "--station_id",
+        help="Station ID to process (accepts a comma-separated list)",
+        required=True,
+    )
+    args = parser.parse_args()
+
+    station_ids = [sid.strip() for sid in args.station_id.split(",") if sid.strip()]
+    if not station_ids:
+        parser.error("--station_id must contain at least one station ID")
+
+    asyncio.run(run_pipeline(station_ids))
+
+
 if __name__ == "__main__":
     main()
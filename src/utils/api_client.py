@@ -1,13 +1,21 @@
-import requests
+import aiohttp
+import asyncio
+import orjson
 from typing import Optional, Dict
 import functools
-import time
 from config.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 MAX_RETRIES = 3
 
+# Session-wide defaults: gzip shrinks the observations payload several-fold,
+# and api.weather.gov asks clients to identify themselves via User-Agent.
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "weather-data-pipeline",
+}
+
 def retry_request_on_failure(
     max_retries: int = MAX_RETRIES, delay: float = 1.0, backoff: float = 2.0
 ):
@@ -20,16 +28,16 @@ def retry_request_on_failure(
         backoff: Backoff multiplier for exponential delay.
 
     Returns:
-        Decorator function that wraps the original function with retry logic.
+        Decorator function that wraps the original coroutine with retry logic.
     """
 
     def decorator(func):
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        async def wrapper(*args, **kwargs):
             for attempt in range(max_retries):
                 try:
-                    return func(*args, **kwargs)
-                except requests.exceptions.RequestException as e:
+                    return await func(*args, **kwargs)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     if attempt == max_retries - 1:
                         logger.error(
                             f"Request failed after {max_retries} attempts: {e}"
@@ -39,7 +47,7 @@ def retry_request_on_failure(
                     logger.warning(
                         f"Request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time}s..."
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
 
         return wrapper
 
@@ -51,26 +59,38 @@ class APIClient:
         """
         Initialize the API client.
 
+        Must be instantiated inside a running event loop so the shared
+        `aiohttp.ClientSession` binds to it.
+
         Args:
             base_url: The base URL for the API.
-            timeout: Request timeout in seconds.
+            timeout: Socket connect/read timeout in seconds.
         """
         self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.session = requests.Session()
-        self.ping()
-
-    def ping(self):
+        # Connect/read timeouts rather than total=: responses are consumed
+        # incrementally with DB work interleaved between reads, so a hard
+        # wall-clock deadline on the whole body would abort large valid
+        # payloads mid-stream. Matches the old requests-client semantics.
+        self.timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=20),
+            timeout=self.timeout,
+            headers=DEFAULT_HEADERS,
+        )
+
+    async def ping(self):
         """Ping the base URL and raise an error if the site is down."""
         try:
-            response = self.session.get(self.base_url, timeout=self.timeout)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
+            async with self.session.get(self.base_url) as response:
+                response.raise_for_status()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Failed to ping base URL '{self.base_url}': {e}")
             raise RuntimeError(f"Base URL '{self.base_url}' is not reachable.") from e
 
     @retry_request_on_failure(delay=1.0, backoff=2.0)
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+    async def get(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> aiohttp.ClientResponse:
         """
         Make a GET request to the specified endpoint.
 
@@ -79,13 +99,57 @@ class APIClient:
             params: Optional query parameters to include in the request.
 
         Returns:
-            requests.Response: The HTTP response object.
+            aiohttp.ClientResponse: The HTTP response object with the body
+                already buffered, so it can be parsed after the connection
+                is released.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        response = await self.session.get(url, params=params)
+        response.raise_for_status()
+        await response.read()
+        return response
+
+    async def get_json(self, endpoint: str, params: Optional[Dict] = None) -> dict:
+        """
+        Make a GET request and parse the response body with orjson.
+
+        orjson decodes at C speed, several times faster than the stdlib
+        json parser aiohttp uses by default. Intended for payloads that fit
+        comfortably in memory; use get_stream for large responses.
+
+        Args:
+            endpoint: The API endpoint to request.
+            params: Optional query parameters to include in the request.
+
+        Returns:
+            dict: The parsed response body.
+        """
+        response = await self.get(endpoint, params=params)
+        return orjson.loads(await response.read())
+
+    @retry_request_on_failure(delay=1.0, backoff=2.0)
+    async def get_stream(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> aiohttp.ClientResponse:
+        """
+        Make a GET request and return the response without buffering the body.
+
+        The caller is responsible for consuming `response.content` and
+        releasing the response when done. Retries only cover connection
+        establishment, not mid-stream failures.
+
+        Args:
+            endpoint: The API endpoint to request.
+            params: Optional query parameters to include in the request.
+
+        Returns:
+            aiohttp.ClientResponse: The HTTP response object with an open body stream.
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.get(url, params=params, timeout=self.timeout)
+        response = await self.session.get(url, params=params)
         response.raise_for_status()
         return response
 
-    def close(self):
+    async def close(self):
         """Close the session."""
-        self.session.close()
+        await self.session.close()